@@ -25,7 +25,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.memory import MemoryJobStore
 
 from config import TOKEN, BOT_MESSAGES, logger, FONT_PATH, FONT_NAME
-from pagespeed_analyzer import PageSpeedAnalyzer
+from pagespeed_analyzer import get_default_analyzer
 from pdf_generator import PDFReportGenerator
 from utils import is_valid_url, generate_filename
 
@@ -90,7 +90,7 @@ class PageSpeedBot:
                                   За замовчуванням використовується з config.py
         """
         self.token = token or TOKEN
-        self.analyzer = PageSpeedAnalyzer()
+        self.analyzer = get_default_analyzer()
         self.pdf_generator = PDFReportGenerator()
         # Initialize scheduler
         self.scheduler = AsyncIOScheduler(jobstores={'default': MemoryJobStore()})
@@ -106,18 +106,21 @@ class PageSpeedBot:
         logger.info(f"Running scheduled job for chat_id {chat_id}, url: {url}")
         try:
             # Аналіз для мобільної та десктопної версій
-            mobile_results = self.analyzer.analyze(url, "mobile")
+            mobile_results, desktop_results = await self.analyzer.analyze_both_async(url)
             if "error" in mobile_results:
                 await application.bot.send_message(chat_id, BOT_MESSAGES["scheduled_error"].format(url=url, error=mobile_results["error"]))
                 return
 
-            desktop_results = self.analyzer.analyze(url, "desktop")
             if "error" in desktop_results:
                 await application.bot.send_message(chat_id, BOT_MESSAGES["scheduled_error"].format(url=url, error=desktop_results["error"]))
                 return
 
             # Створення PDF зі звітом
-            pdf_bytes = self.pdf_generator.generate_report(url, mobile_results, desktop_results)
+            # Дата у звіті - час аналізу, а не генерації: результати можуть бути з кешу
+            pdf_bytes = self.pdf_generator.generate_report(
+                url, mobile_results, desktop_results,
+                generated_at=min(mobile_results["analyzed_at"], desktop_results["analyzed_at"])
+            )
             pdf_bytes.seek(0)
             filename = generate_filename(url, prefix="scheduled")
 
@@ -221,8 +224,7 @@ class PageSpeedBot:
 
         try:
             # Perform analysis for both mobile and desktop
-            mobile_results = self.analyzer.analyze(url, "mobile")
-            desktop_results = self.analyzer.analyze(url, "desktop")
+            mobile_results, desktop_results = await self.analyzer.analyze_both_async(url)
 
             # Check for errors during analysis
             if "error" in mobile_results or "error" in desktop_results:
@@ -231,7 +233,11 @@ class PageSpeedBot:
                 return
 
             # Generate PDF report
-            pdf_bytes = self.pdf_generator.generate_report(url, mobile_results, desktop_results)
+            # Дата у звіті - час аналізу, а не генерації: результати можуть бути з кешу
+            pdf_bytes = self.pdf_generator.generate_report(
+                url, mobile_results, desktop_results,
+                generated_at=min(mobile_results["analyzed_at"], desktop_results["analyzed_at"])
+            )
             pdf_bytes.seek(0)
             filename = generate_filename(url, prefix="full_report")
 
@@ -268,8 +274,7 @@ class PageSpeedBot:
         try:
             # Analyze first URL
             await update.message.reply_text(f"Аналізую {url1}...")
-            mobile1 = self.analyzer.analyze(url1, "mobile")
-            desktop1 = self.analyzer.analyze(url1, "desktop")
+            mobile1, desktop1 = await self.analyzer.analyze_both_async(url1)
             if "error" in mobile1 or "error" in desktop1:
                 error_msg = mobile1.get("error", "") or desktop1.get("error", "")
                 await update.message.reply_text(BOT_MESSAGES["analysis_error"].format(url=url1, error=error_msg))
@@ -278,8 +283,7 @@ class PageSpeedBot:
 
             # Analyze second URL
             await update.message.reply_text(f"Аналізую {url2}...")
-            mobile2 = self.analyzer.analyze(url2, "mobile")
-            desktop2 = self.analyzer.analyze(url2, "desktop")
+            mobile2, desktop2 = await self.analyzer.analyze_both_async(url2)
             if "error" in mobile2 or "error" in desktop2:
                 error_msg = mobile2.get("error", "") or desktop2.get("error", "")
                 await update.message.reply_text(BOT_MESSAGES["analysis_error"].format(url=url2, error=error_msg))
@@ -449,8 +453,7 @@ class PageSpeedBot:
 
         try:
             # Perform analysis for both mobile and desktop
-            mobile_results = self.analyzer.analyze(url, "mobile")
-            desktop_results = self.analyzer.analyze(url, "desktop")
+            mobile_results, desktop_results = await self.analyzer.analyze_both_async(url)
 
             # Check for errors
             if "error" in mobile_results or "error" in desktop_results:
@@ -459,7 +462,11 @@ class PageSpeedBot:
                 return
 
             # Generate PDF report
-            pdf_bytes = self.pdf_generator.generate_report(url, mobile_results, desktop_results)
+            # Дата у звіті - час аналізу, а не генерації: результати можуть бути з кешу
+            pdf_bytes = self.pdf_generator.generate_report(
+                url, mobile_results, desktop_results,
+                generated_at=min(mobile_results["analyzed_at"], desktop_results["analyzed_at"])
+            )
             pdf_bytes.seek(0)
             filename = generate_filename(url, prefix="report")
 
@@ -39,6 +39,10 @@ if not PAGESPEED_API_KEY:
 
 PAGESPEED_API_URL = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
 
+# Кешування успішних результатів PageSpeed (TTL у секундах, 0 вимикає кеш)
+PAGESPEED_CACHE_TTL = int(os.environ.get("PAGESPEED_CACHE_TTL", 900))
+PAGESPEED_CACHE_MAXSIZE = int(os.environ.get("PAGESPEED_CACHE_MAXSIZE", 128))
+
 # Шлях до українського шрифту для PDF та візуалізацій
 DEFAULT_FONT_PATH = str(BASE_DIR / "fonts" / "Roboto-VariableFont_wdth,wght.ttf") # Correct path to Roboto
 FONT_PATH = os.environ.get("PDF_FONT_PATH", DEFAULT_FONT_PATH)
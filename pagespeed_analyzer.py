@@ -5,21 +5,31 @@
 Модуль для взаємодії з Google PageSpeed Insights API
 """
 
-import requests
-import logging
-import re
+import asyncio
 import json
-import colorsys
-from bs4 import BeautifulSoup
-from http.cookies import SimpleCookie
+import threading
 import time
+from bisect import bisect_right
+from datetime import datetime
+import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-import asyncio  # For potential async implementation later
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import math  # Add math import for calculations
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+# orjson (якщо встановлено) розбирає великі відповіді Lighthouse у кілька разів швидше
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from config import (
+    PAGESPEED_API_KEY, PAGESPEED_API_URL, PAGESPEED_CACHE_TTL, PAGESPEED_CACHE_MAXSIZE,
+    KEY_METRICS, logger
+)
 
-from config import PAGESPEED_API_KEY, PAGESPEED_API_URL, KEY_METRICS, logger
+# Пари (id аудиту, назва метрики), що обходяться при кожному аналізі
+_KEY_METRIC_ITEMS = tuple(KEY_METRICS.items())
 
 # Add Ukrainian translations for prioritization
 PRIORITIZATION_TERMS_UK = {
@@ -61,25 +71,98 @@ AUDIT_HEURISTICS = {
     "default": {"difficulty": "medium", "category": "other"},
 }
 
+# AUDIT_HEURISTICS resolved once to (difficulty, category key, Ukrainian category name)
+AUDIT_HEURISTICS_RESOLVED = {
+    audit_id: (
+        heuristics["difficulty"],
+        heuristics["category"],
+        PRIORITIZATION_TERMS_UK["categories"].get(
+            heuristics["category"], PRIORITIZATION_TERMS_UK["categories"]["other"]
+        ),
+    )
+    for audit_id, heuristics in AUDIT_HEURISTICS.items()
+}
+
 # Define impact thresholds (in milliseconds)
 IMPACT_THRESHOLDS_MS = {
     "high": 1000,
     "medium": 250,
 }
 
+# Standard Lighthouse rating cut-offs (0.9+ = good, 0.5-0.89 = average, <0.5 = poor)
+METRIC_RATING_CUTOFFS = (0.5, 0.9)
+METRIC_RATINGS = ("poor", "average", "good")
+
+# Partial-response mask for the PageSpeed API: only the performance score and the
+# audits are kept (no CrUX field data, stack packs, i18n, timing or
+# fullPageScreenshot). Audits are returned whole, so hidden audits such as
+# final-screenshot, screenshot-thumbnails (base64 images), script-treemap-data
+# and network-requests are still included and make up most of the payload.
+# A narrower per-audit mask (audits/*(...)) would drop them, but it has not
+# been verified against the live API yet, and a rejected selector fails every call
+PAGESPEED_RESPONSE_FIELDS = "lighthouseResult(categories/performance/score,audits)"
+
+# Least common multiple of the difficulty scores: impact * 6 // difficulty is an
+# exact integer, so recommendations can be ranked without float arithmetic
+PRIORITY_RANK_SCALE = 6
+
+# Lighthouse display modes that can yield actionable recommendations
+RECOMMENDATION_DISPLAY_MODES = frozenset({"opportunity", "numeric", "binary"})
+
 # Define score mapping for impact and difficulty
 SCORE_MAPPING = {
     "impact": {"high": 3, "medium": 2, "low": 1},
     "difficulty": {"easy": 1, "medium": 2, "hard": 3},
 }
 
+# Per-level (Ukrainian label, numeric score) pairs, resolved once at import
+IMPACT_LEVEL_ROWS = {
+    level: (PRIORITIZATION_TERMS_UK["impact"][level], score)
+    for level, score in SCORE_MAPPING["impact"].items()
+}
+DIFFICULTY_LEVEL_ROWS = {
+    level: (PRIORITIZATION_TERMS_UK["difficulty"][level], score)
+    for level, score in SCORE_MAPPING["difficulty"].items()
+}
+
+
+def _iter_actionable(audits):
+    """
+    Відбирає аудити, для яких варто формувати рекомендації.
+
+    Залишаються лише не пройдені аудити з режимом з RECOMMENDATION_DISPLAY_MODES,
+    що мають назву та опис; спискове включення відкидає більшість
+    із ~150 аудитів Lighthouse ще до основного циклу оцінювання.
+
+    Args:
+        audits (dict): Словник аудитів з результату Lighthouse
+
+    Returns:
+        list: Список пар (audit_id, audit)
+    """
+    allowed_modes = RECOMMENDATION_DISPLAY_MODES
+    return [
+        (audit_id, audit) for audit_id, audit in audits.items()
+        if audit.get("score") != 1
+        and audit.get("scoreDisplayMode") in allowed_modes
+        and audit.get("title")
+        and audit.get("description")
+    ]
+
 
 class PageSpeedAnalyzer:
     """
     Клас для аналізу URL за допомогою Google PageSpeed Insights API.
+
+    Клас використовує __slots__; підкласи, яким потрібні нові атрибути,
+    мають оголосити власні __slots__ або додати "__dict__".
     """
+
+    __slots__ = ("api_key", "api_url", "include_raw", "cache_ttl", "session", "headers",
+                 "_cache", "_cache_lock", "_cache_hits", "_cache_misses",
+                 "_inflight", "_inflight_lock")
     
-    def __init__(self, api_key=None, api_url=None):
+    def __init__(self, api_key=None, api_url=None, include_raw=False, cache_ttl=None):
         """
         Ініціалізує аналізатор PageSpeed.
         
@@ -88,31 +171,62 @@ class PageSpeedAnalyzer:
                                     За замовчуванням використовується з config.py
             api_url (str, optional): URL API Google PageSpeed.
                                     За замовчуванням використовується з config.py
+            include_raw (bool, optional): Додавати до результатів raw_lighthouse_result.
+                                         За замовчуванням False, щоб не тримати в пам'яті
+                                         (і в кеші) всю відповідь Lighthouse
+            cache_ttl (float, optional): Час життя кешованих результатів у секундах,
+                                        0 вимикає кеш. За замовчуванням PAGESPEED_CACHE_TTL
         """
         self.api_key = api_key or PAGESPEED_API_KEY
         self.api_url = api_url or PAGESPEED_API_URL
+        self.include_raw = include_raw
+        self.cache_ttl = PAGESPEED_CACHE_TTL if cache_ttl is None else cache_ttl
         self.session = requests.Session()  # Використовуємо сесію для запитів
         
         # Налаштування заголовків для запитів
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
+        self.session.headers.update(self.headers)  # Заголовки задаються один раз на рівні сесії
         
-        # Configure retries for transient errors (timeouts, 5xx)
+        # Configure retries for transient errors (timeouts, 429 quota, 5xx)
         retry_strategy = Retry(
             total=3,  # Total number of retries
-            backoff_factor=1,  # Exponential backoff factor (e.g., 1s, 2s, 4s)
-            status_forcelist=[500, 502, 503, 504],  # Retry on these server errors
-            allowed_methods=["GET"]  # Only retry GET requests
+            backoff_factor=0.5,  # Exponential backoff factor (e.g., 0.5s, 1s, 2s)
+            status_forcelist=[429, 500, 502, 503, 504],  # Retry on rate limits and server errors
+            allowed_methods=["GET"],  # Only retry GET requests
+            respect_retry_after_header=True  # Honour Retry-After on 429/503
+        )
+        # Pool sized for concurrent analyze calls (analyze_many) so extra
+        # connections are kept alive instead of being discarded
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
+
+        # Кеш успішних результатів {(url, strategy): (час збереження, результат)};
+        # analyze викликається з кількох потоків, тому доступ - лише під _cache_lock
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Запити, що виконуються зараз {(url, strategy): Future}; однакові
+        # одночасні виклики чекають на один запит до API замість дублювання
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
     
     def analyze(self, url, strategy="mobile"):
         """
         Аналізує URL за допомогою Google PageSpeed Insights API.
+
+        Успішні результати кешуються на cache_ttl секунд, тому
+        повторний аналіз того самого URL не звертається до API.
         
         Args:
             url (str): URL для аналізу
@@ -124,10 +238,113 @@ class PageSpeedAnalyzer:
                 - score: загальна оцінка продуктивності (0-100)
                 - metrics: словник з основними метриками
                 - prioritized_recommendations: структурований об'єкт з пріоритезованими рекомендаціями
-                - raw_lighthouse_result: Повний результат Lighthouse (для можливого подальшого аналізу)
+                - analyzed_at: datetime, коли результат було отримано від API
+                - raw_lighthouse_result: Результат Lighthouse, обмежений PAGESPEED_RESPONSE_FIELDS
+                  (оцінка продуктивності та аудити); лише якщо include_raw=True
                 
                 У разі помилки повертає словник з ключем "error"
         """
+        cache_key = (url, strategy)
+        cached = self._get_cached(cache_key)
+        if cached is None:
+            with self._inflight_lock:
+                future = self._inflight.get(cache_key)
+                is_owner = future is None
+                if is_owner:
+                    # Попередній власник міг зберегти результат і зняти свій Future
+                    # між першою перевіркою та цим блокуванням - перевіряємо кеш ще раз
+                    cached = self._get_cached(cache_key)
+                    if cached is None:
+                        future = Future()
+                        self._inflight[cache_key] = future
+
+        if cached is not None:
+            with self._cache_lock:
+                self._cache_hits += 1
+                hits, misses = self._cache_hits, self._cache_misses
+            logger.debug(
+                f"Кеш PageSpeed: влучання для {url} ({strategy}); "
+                f"влучань {hits}, промахів {misses}"
+            )
+            return cached
+
+        if not is_owner:
+            logger.debug(f"Очікування на запит PageSpeed, що вже виконується: {url} ({strategy})")
+            return future.result()
+
+        with self._cache_lock:
+            self._cache_misses += 1
+        try:
+            results = self._request_analysis(url, strategy)
+            if "error" not in results:
+                self._store_cached(cache_key, results)
+            future.set_result(results)
+            return results
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def invalidate(self, url):
+        """
+        Видаляє з кешу результати для URL (для всіх стратегій).
+
+        Args:
+            url (str): URL, результати якого потрібно скинути
+        """
+        with self._cache_lock:
+            for key in [key for key in self._cache if key[0] == url]:
+                del self._cache[key]
+
+    def clear_cache(self):
+        """Повністю очищує кеш результатів та скидає лічильники влучань/промахів."""
+        with self._cache_lock:
+            entries, hits, misses = len(self._cache), self._cache_hits, self._cache_misses
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+        logger.info(
+            f"Очищення кешу PageSpeed: записів {entries}, "
+            f"влучань {hits}, промахів {misses}"
+        )
+
+    def _get_cached(self, key):
+        """Повертає результат з кешу, якщо він ще не застарів, інакше None."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            stored_at, results = entry
+            if time.monotonic() - stored_at >= self.cache_ttl:
+                del self._cache[key]
+                return None
+            return results
+
+    def _store_cached(self, key, results):
+        """Зберігає результат у кеші, витісняючи найстаріші записи при переповненні."""
+        if self.cache_ttl <= 0 or PAGESPEED_CACHE_MAXSIZE <= 0:
+            return
+
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            while len(self._cache) >= PAGESPEED_CACHE_MAXSIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (time.monotonic(), results)
+
+    def _request_analysis(self, url, strategy):
+        """
+        Виконує запит до PageSpeed Insights API та обробляє відповідь.
+
+        Args:
+            url (str): URL для аналізу
+            strategy (str): Стратегія аналізу ('mobile' або 'desktop')
+
+        Returns:
+            dict: Результати аналізу (див. analyze()) або словник з ключем "error"
+        """
         try:
             # Параметри запиту
             params = {
@@ -136,19 +353,19 @@ class PageSpeedAnalyzer:
                 "key": self.api_key,
                 "locale": "uk",  # Локалізація українською, якщо доступно
                 "category": "performance",  # Зосереджуємося на продуктивності
+                "fields": PAGESPEED_RESPONSE_FIELDS,  # Лише потрібні частини відповіді
             }
             
             # Виконання запиту до API
             response = self.session.get(
                 self.api_url,
                 params=params,
-                headers=self.headers,
                 timeout=120  # Збільшений таймаут для великих сторінок
             )
             response.raise_for_status()
             
             # Обробка відповіді
-            data = response.json()
+            data = _json_loads(response.content)
             
             # Перевірка наявності помилки в результаті API
             if "error" in data:
@@ -167,14 +384,19 @@ class PageSpeedAnalyzer:
                 "score": int(lighthouse_result["categories"]["performance"]["score"] * 100),
                 "metrics": {},
                 "prioritized_recommendations": {},  # Initialize as empty dict
-                "raw_lighthouse_result": lighthouse_result  # Include raw result
+                # Час отримання даних від API (результат може повертатися з кешу пізніше)
+                "analyzed_at": datetime.now(),
             }
+            if self.include_raw:
+                results["raw_lighthouse_result"] = lighthouse_result
             
             # Отримання основних метрик
-            for metric_id, display_name in KEY_METRICS.items():
-                if metric_id in audits:
-                    metric = audits[metric_id]
-                    results["metrics"][display_name] = {
+            metrics = results["metrics"]
+            audits_get = audits.get
+            for metric_id, display_name in _KEY_METRIC_ITEMS:
+                metric = audits_get(metric_id)
+                if metric is not None:
+                    metrics[display_name] = {
                         "value": metric.get("displayValue", "N/A"),
                         "rating": self._get_metric_rating(metric),
                         "score": metric.get("score", 0),
@@ -195,6 +417,117 @@ class PageSpeedAnalyzer:
             logger.error(f"Невідома помилка: {e}", exc_info=True)
             return {"error": f"Невідома помилка: {str(e)}"}
 
+    def analyze_both(self, url):
+        """
+        Аналізує URL одночасно для мобільної та десктопної стратегій.
+
+        Args:
+            url (str): URL для аналізу
+
+        Returns:
+            tuple: (mobile_results, desktop_results) у форматі analyze()
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mobile_future = executor.submit(self.analyze, url, "mobile")
+            desktop_future = executor.submit(self.analyze, url, "desktop")
+            return mobile_future.result(), desktop_future.result()
+
+    async def analyze_async(self, url, strategy="mobile"):
+        """
+        Асинхронна обгортка над analyze() для використання з asyncio.
+
+        Запит виконується у пулі потоків циклу подій, тому не блокує
+        інші обробники під час очікування відповіді API.
+
+        Args:
+            url (str): URL для аналізу
+            strategy (str, optional): Стратегія аналізу ('mobile' або 'desktop').
+                                     За замовчуванням "mobile"
+
+        Returns:
+            dict: Результати аналізу у форматі analyze()
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze, url, strategy)
+
+    async def analyze_both_async(self, url):
+        """
+        Асинхронно аналізує URL одночасно для мобільної та десктопної стратегій.
+
+        Args:
+            url (str): URL для аналізу
+
+        Returns:
+            tuple: (mobile_results, desktop_results) у форматі analyze()
+        """
+        mobile_results, desktop_results = await asyncio.gather(
+            self.analyze_async(url, "mobile"),
+            self.analyze_async(url, "desktop")
+        )
+        return mobile_results, desktop_results
+
+    def analyze_many(self, urls, strategy="mobile", concurrency=8):
+        """
+        Аналізує кілька URL паралельно з обмеженою кількістю одночасних запитів.
+
+        Args:
+            urls (iterable): URL для аналізу
+            strategy (str, optional): Стратегія аналізу ('mobile' або 'desktop').
+                                     За замовчуванням "mobile"
+            concurrency (int, optional): Максимальна кількість одночасних запитів до API.
+                                        За замовчуванням 8
+
+        Returns:
+            dict: Словник {url: результат analyze()} у порядку вхідних URL
+
+        Raises:
+            ValueError: Якщо concurrency менше 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency має бути не менше 1, отримано {concurrency}")
+
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(unique_urls))) as executor:
+            futures = {executor.submit(self.analyze, url, strategy): url for url in unique_urls}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return {url: results[url] for url in unique_urls}
+
+    async def analyze_many_async(self, urls, strategy="mobile", concurrency=8):
+        """
+        Асинхронно аналізує кілька URL з обмеженою кількістю одночасних запитів.
+
+        Args:
+            urls (iterable): URL для аналізу
+            strategy (str, optional): Стратегія аналізу ('mobile' або 'desktop').
+                                     За замовчуванням "mobile"
+            concurrency (int, optional): Максимальна кількість одночасних запитів до API.
+                                        За замовчуванням 8
+
+        Returns:
+            dict: Словник {url: результат analyze()} у порядку вхідних URL
+
+        Raises:
+            ValueError: Якщо concurrency менше 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency має бути не менше 1, отримано {concurrency}")
+
+        unique_urls = list(dict.fromkeys(urls))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze_limited(url):
+            async with semaphore:
+                return await self.analyze_async(url, strategy)
+
+        results = await asyncio.gather(*(analyze_limited(url) for url in unique_urls))
+        return dict(zip(unique_urls, results))
+
     def _get_metric_rating(self, metric):
         """
         Визначає рейтинг метрики ('good', 'average', 'poor') на основі її оцінки.
@@ -209,13 +542,8 @@ class PageSpeedAnalyzer:
         if score is None:
             return "N/A"  # Або інше значення за замовчуванням
 
-        # Стандартні пороги Lighthouse (0.9+ = good, 0.5-0.89 = average, <0.5 = poor)
-        if score >= 0.9:
-            return "good"
-        elif score >= 0.5:
-            return "average"
-        else:
-            return "poor"
+        # Стандартні пороги Lighthouse; bisect_right робить межі 0.5 та 0.9 включними
+        return METRIC_RATINGS[bisect_right(METRIC_RATING_CUTOFFS, score)]
 
     def _prioritize_and_categorize_recommendations(self, audits):
         """
@@ -242,54 +570,62 @@ class PageSpeedAnalyzer:
             "difficulty_counts": { "easy": 0, "medium": 0, "hard": 0 },
         }
 
-        for audit_id, audit in audits.items():
-            # Consider only opportunities and diagnostics with potential savings
-            display_mode = audit.get("scoreDisplayMode")
-            if display_mode not in ["opportunity", "numeric", "binary"] or audit.get("score") == 1:
-                continue
+        # Константи, що використовуються в циклі, прив'язуються до локальних імен один раз
+        high_threshold_ms = IMPACT_THRESHOLDS_MS["high"]
+        medium_threshold_ms = IMPACT_THRESHOLDS_MS["medium"]
+        resolved_heuristics = AUDIT_HEURISTICS_RESOLVED
+        default_heuristics = resolved_heuristics["default"]
+        impact_rows = IMPACT_LEVEL_ROWS
+        difficulty_rows = DIFFICULTY_LEVEL_ROWS
 
-            if not audit.get("title") or not audit.get("description"):
-                continue
+        for audit_id, audit in _iter_actionable(audits):
+            display_mode = audit["scoreDisplayMode"]
+            title = audit["title"]
+            description = audit["description"]
 
             # Determine Impact
+            details = audit.get("details")
+            numeric_value = audit.get("numericValue")
             potential_savings_ms = 0
-            if display_mode == "opportunity" and "details" in audit and audit["details"].get("overallSavingsMs"):
-                potential_savings_ms = audit["details"]["overallSavingsMs"]
-            elif display_mode == "numeric" and "numericValue" in audit:
+            if display_mode == "opportunity" and details and details.get("overallSavingsMs"):
+                potential_savings_ms = details["overallSavingsMs"]
+            elif display_mode == "numeric" and numeric_value is not None:
                 if "ms" in audit.get("numericUnit", ""):
-                     potential_savings_ms = audit.get("numericValue", 0)
+                     potential_savings_ms = numeric_value
 
             impact_level = "low"
-            if potential_savings_ms >= IMPACT_THRESHOLDS_MS["high"]:
+            if potential_savings_ms >= high_threshold_ms:
                 impact_level = "high"
-            elif potential_savings_ms >= IMPACT_THRESHOLDS_MS["medium"]:
+            elif potential_savings_ms >= medium_threshold_ms:
                 impact_level = "medium"
 
             # Determine Difficulty & Category
-            heuristics = AUDIT_HEURISTICS.get(audit_id, AUDIT_HEURISTICS["default"])
-            difficulty_level = heuristics["difficulty"]
-            category_key = heuristics["category"]
-            category_name_uk = PRIORITIZATION_TERMS_UK["categories"].get(category_key, PRIORITIZATION_TERMS_UK["categories"]["other"])
+            difficulty_level, category_key, category_name_uk = resolved_heuristics.get(
+                audit_id, default_heuristics
+            )
 
             # Calculate Priority Score
-            impact_score_num = SCORE_MAPPING["impact"].get(impact_level, 1)
-            difficulty_score_num = SCORE_MAPPING["difficulty"].get(difficulty_level, 2)
+            impact_level_uk, impact_score_num = impact_rows[impact_level]
+            difficulty_level_uk, difficulty_score_num = difficulty_rows[difficulty_level]
             priority_score = (impact_score_num / difficulty_score_num) + (impact_score_num * 0.01)
+            # Integer equivalent of priority_score used for sorting: ratio first, impact as tie-break
+            priority_rank = (impact_score_num * PRIORITY_RANK_SCALE // difficulty_score_num) * 10 + impact_score_num
 
             # Create Recommendation Object
             recommendation = {
                 "id": audit_id,
-                "title": audit.get("title", "N/A"),
-                "description": audit.get("description", ""),
+                "title": title,
+                "description": description,
                 "impact_level": impact_level,
-                "impact_level_uk": PRIORITIZATION_TERMS_UK["impact"].get(impact_level, impact_level),
+                "impact_level_uk": impact_level_uk,
                 "difficulty_level": difficulty_level,
-                "difficulty_level_uk": PRIORITIZATION_TERMS_UK["difficulty"].get(difficulty_level, difficulty_level),
+                "difficulty_level_uk": difficulty_level_uk,
                 "category_key": category_key,
                 "category_name_uk": category_name_uk,
                 "potential_savings_ms": round(potential_savings_ms) if potential_savings_ms else None,
                 "priority_score": round(priority_score, 2),
-                "details": audit.get("details"),
+                "priority_rank": priority_rank,
+                "details": details,
             }
             recommendations_list.append(recommendation)
 
@@ -299,17 +635,37 @@ class PageSpeedAnalyzer:
             summary["difficulty_counts"][difficulty_level] += 1
 
         # Sort Recommendations by Priority Score (Descending)
-        recommendations_list.sort(key=lambda x: x["priority_score"], reverse=True)
+        recommendations_list.sort(key=lambda x: x["priority_rank"], reverse=True)
 
-        # Group by Category
+        # Group by Category (порядок пріоритету зберігається всередині категорій)
         categorized_recommendations = {}
         for rec in recommendations_list:
-            category = rec["category_name_uk"]
-            if category not in categorized_recommendations:
-                categorized_recommendations[category] = []
-            categorized_recommendations[category].append(rec)
+            categorized_recommendations.setdefault(rec["category_name_uk"], []).append(rec)
 
         return {
             "categories": categorized_recommendations,
             "summary": summary
-        }
\ No newline at end of file
+        }
+
+
+_default_analyzer = None
+_default_analyzer_lock = threading.Lock()
+
+
+def get_default_analyzer():
+    """
+    Повертає спільний для процесу екземпляр PageSpeedAnalyzer.
+
+    Один екземпляр тримає відкритими з'єднання сесії requests та кеш
+    результатів, тому повторні аналізи не повторюють DNS/TLS-рукостискання.
+    Для іншого ключа API створюйте PageSpeedAnalyzer напряму.
+
+    Returns:
+        PageSpeedAnalyzer: Спільний аналізатор з налаштуваннями з config.py
+    """
+    global _default_analyzer
+    if _default_analyzer is None:
+        with _default_analyzer_lock:
+            if _default_analyzer is None:
+                _default_analyzer = PageSpeedAnalyzer()
+    return _default_analyzer
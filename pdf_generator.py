@@ -6,130 +6,324 @@
 """
 
 import io
+import os
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.ttfonts import TTFont, TTFError, TTFOpenFile
 from reportlab.lib.units import cm
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 
 from config import FONT_PATH, PDF_AUTHOR, PDF_TITLE, PDF_SUBJECT, logger
-from utils import get_score_status
+from utils import get_score_status as _get_score_status
 from pagespeed_analyzer import PRIORITIZATION_TERMS_UK, IMPACT_THRESHOLDS_MS, SCORE_MAPPING
 
+# Оцінки - цілі числа 0-100, тому статус для кожної обчислюється лише раз
+get_score_status = lru_cache(maxsize=128)(_get_score_status)
+
+
+def _resolve_font_path(font_path):
+    """
+    Знаходить файл шрифту так само, як це робить TTFont.
+
+    Відносні назви (наприклад, "Vera.ttf") шукаються також у
+    rl_config.TTFSearchPath, а не лише відносно робочого каталогу.
+
+    Args:
+        font_path (str or PathLike): Шлях або назва файлу шрифту
+
+    Returns:
+        str: Знайдений шлях до файлу або None, якщо шрифт не знайдено
+    """
+    try:
+        resolved_path, font_file = TTFOpenFile(os.fspath(font_path))
+    except TTFError:
+        return None
+    font_file.close()
+    return resolved_path
+
+
+# Шлях до шрифту за замовчуванням визначається один раз під час імпорту;
+# None, якщо шрифт не знайдено (config.py вже попереджає про відсутній файл)
+_RESOLVED_FONT_PATH = _resolve_font_path(FONT_PATH) if FONT_PATH else None
+
+# Кольори звіту (HexColor розбирається один раз під час імпорту)
+HEADER_BG_COLOR = colors.HexColor("#1a365d")  # Темно-синій
+GOOD_BG_COLOR = colors.HexColor("#d4edda")  # Світло-зелений
+GOOD_TEXT_COLOR = colors.HexColor("#155724")  # Темно-зелений
+AVERAGE_BG_COLOR = colors.HexColor("#fff3cd")  # Світло-жовтий
+AVERAGE_TEXT_COLOR = colors.HexColor("#856404")  # Темно-жовтий
+POOR_BG_COLOR = colors.HexColor("#f8d7da")  # Світло-червоний
+POOR_TEXT_COLOR = colors.HexColor("#721c24")  # Темно-червоний
+MOBILE_COLOR = colors.HexColor("#3182ce")  # Синій для мобільного
+DESKTOP_COLOR = colors.HexColor("#38a169")  # Зелений для десктопу
+
+# Межі оцінки (0-100) між "поганою", "середньою" та "доброю" зонами
+SCORE_COLOR_THRESHOLDS = (50, 90)
+
 
 class PDFReportGenerator:
     """
     Клас для генерації PDF-звітів з результатами аналізу PageSpeed.
     """
+
+    # Шлях до шрифту, вже зареєстрованого як "Ukrainian" у pdfmetrics (спільно для всіх екземплярів)
+    _registered_font_path = None
+
+    # Набори стилів абзаців і таблиць, спільні для всіх екземплярів з тим самим шрифтом:
+    # {font_name: dict з _build_paragraph_styles та _build_table_styles}.
+    # Об'єкти в наборах не можна змінювати на місці - зміни побачать усі генератори
+    _shared_styles = {}
     
     def __init__(self, font_path=None):
         """
         Ініціалізує генератор PDF-звітів.
         
         Args:
-            font_path (str, optional): Шлях до українського шрифту.
+            font_path (str or PathLike, optional): Шлях до українського шрифту.
                                       За замовчуванням використовується з config.py
         """
-        self.font_path = font_path or FONT_PATH
+        self.font_path = os.fspath(font_path) if font_path else _RESOLVED_FONT_PATH
         self._register_fonts()
-        self._init_styles()
         self._init_colors()
+        self._init_styles()
     
     def _register_fonts(self):
         """Реєструє українські шрифти для використання в PDF."""
         self.use_ukrainian_font = False
         
-        # Реєстрація стандартного шрифту як запасного варіанту
-        try:
-            pdfmetrics.registerFont(TTFont("DefaultFont", "Helvetica"))
-        except Exception:
-            pass
-        
-        if self.font_path:
+        # Запасний Helvetica є стандартним шрифтом PDF і реєстрації не потребує
+        if (self.font_path and self.font_path == PDFReportGenerator._registered_font_path
+                and "Ukrainian" in pdfmetrics.getRegisteredFontNames()):
+            # TTF вже розібрано та зареєстровано іншим екземпляром
+            self.use_ukrainian_font = True
+        elif self.font_path:
             try:
                 pdfmetrics.registerFont(TTFont("Ukrainian", self.font_path))
+                PDFReportGenerator._registered_font_path = self.font_path
                 self.use_ukrainian_font = True
                 logger.info(f"Шрифт успішно зареєстровано: {self.font_path}")
             except Exception as e:
                 logger.error(f"Помилка при реєстрації шрифту: {e}", exc_info=True)
                 logger.warning("Використовую стандартний шрифт замість українського")
         else:
-            logger.warning("Шлях до шрифту не вказано. Використовую стандартний шрифт")
+            logger.warning("Шлях до шрифту не вказано або файл не знайдено. Використовую стандартний шрифт")
     
     def _init_styles(self):
-        """Ініціалізує стилі для PDF-документу."""
-        self.styles = getSampleStyleSheet()
-        
+        """
+        Прив'язує до екземпляра стилі абзаців і таблиць для обраного шрифту.
+
+        Набір стилів будується один раз для кожного шрифту й кешується в
+        _shared_styles, тому всі атрибути нижче - спільні об'єкти.
+        """
         # Вибір шрифту в залежності від успішності реєстрації українського шрифту
         font_name = "Ukrainian" if self.use_ukrainian_font else "Helvetica"
-        
-        # Створення стилів
-        self.title_style = ParagraphStyle(
-            "UkrainianTitle",
-            parent=self.styles["Title"],
-            fontName=font_name,
-            fontSize=18,
-            spaceAfter=12
-        )
-        
-        self.heading_style = ParagraphStyle(
-            "UkrainianHeading",
-            parent=self.styles["Heading1"],
-            fontName=font_name,
-            fontSize=16,
-            spaceAfter=10
-        )
-        
-        self.subheading_style = ParagraphStyle(
-            "UkrainianSubheading",
-            parent=self.styles["Heading2"],
-            fontName=font_name,
-            fontSize=14,
-            spaceAfter=8
-        )
-        
-        self.normal_style = ParagraphStyle(
-            "UkrainianNormal",
-            parent=self.styles["Normal"],
-            fontName=font_name,
-            fontSize=12,
-            spaceAfter=6
-        )
-        
-        self.small_style = ParagraphStyle(
-            "UkrainianSmall",
-            parent=self.styles["Normal"],
-            fontName=font_name,
-            fontSize=10,
-            spaceAfter=4
-        )
+
+        shared = PDFReportGenerator._shared_styles.get(font_name)
+        if shared is None:
+            shared = {
+                **self._build_paragraph_styles(font_name),
+                **self._build_table_styles(font_name),
+            }
+            PDFReportGenerator._shared_styles[font_name] = shared
+
+        self.styles = shared["styles"]
+        self.title_style = shared["title_style"]
+        self.heading_style = shared["heading_style"]
+        self.subheading_style = shared["subheading_style"]
+        self.normal_style = shared["normal_style"]
+        self.small_style = shared["small_style"]
+
+        self.scores_table_style = shared["scores_table_style"]
+        self.metrics_table_style = shared["metrics_table_style"]
+        self.recommendations_table_style = shared["recommendations_table_style"]
+        self.summary_table_style = shared["summary_table_style"]
+        # Навмисно спільний кеш готових стилів таблиці оцінок
+        self.scores_table_styles = shared["scores_table_styles"]
+
+    @staticmethod
+    def _build_paragraph_styles(font_name):
+        """
+        Створює стилі абзаців для PDF-документу.
+
+        Args:
+            font_name (str): Назва зареєстрованого шрифту
+
+        Returns:
+            dict: Базовий набір стилів ("styles") та стилі абзаців звіту
+        """
+        styles = getSampleStyleSheet()
+
+        return {
+            "styles": styles,
+            "title_style": ParagraphStyle(
+                "UkrainianTitle",
+                parent=styles["Title"],
+                fontName=font_name,
+                fontSize=18,
+                spaceAfter=12
+            ),
+
+            "heading_style": ParagraphStyle(
+                "UkrainianHeading",
+                parent=styles["Heading1"],
+                fontName=font_name,
+                fontSize=16,
+                spaceAfter=10
+            ),
+
+            "subheading_style": ParagraphStyle(
+                "UkrainianSubheading",
+                parent=styles["Heading2"],
+                fontName=font_name,
+                fontSize=14,
+                spaceAfter=8
+            ),
+
+            "normal_style": ParagraphStyle(
+                "UkrainianNormal",
+                parent=styles["Normal"],
+                fontName=font_name,
+                fontSize=12,
+                spaceAfter=6
+            ),
+
+            "small_style": ParagraphStyle(
+                "UkrainianSmall",
+                parent=styles["Normal"],
+                fontName=font_name,
+                fontSize=10,
+                spaceAfter=4
+            ),
+        }
     
     def _init_colors(self):
         """Ініціалізує кольори для використання в звіті."""
         # Кольори для заголовків
-        self.header_bg_color = colors.HexColor("#1a365d")  # Темно-синій
+        self.header_bg_color = HEADER_BG_COLOR
         self.header_text_color = colors.white
         
         # Кольори для рейтингів
-        self.good_bg_color = colors.HexColor("#d4edda")  # Світло-зелений
-        self.good_text_color = colors.HexColor("#155724")  # Темно-зелений
+        self.good_bg_color = GOOD_BG_COLOR
+        self.good_text_color = GOOD_TEXT_COLOR
         
-        self.average_bg_color = colors.HexColor("#fff3cd")  # Світло-жовтий
-        self.average_text_color = colors.HexColor("#856404")  # Темно-жовтий
+        self.average_bg_color = AVERAGE_BG_COLOR
+        self.average_text_color = AVERAGE_TEXT_COLOR
         
-        self.poor_bg_color = colors.HexColor("#f8d7da")  # Світло-червоний
-        self.poor_text_color = colors.HexColor("#721c24")  # Темно-червоний
+        self.poor_bg_color = POOR_BG_COLOR
+        self.poor_text_color = POOR_TEXT_COLOR
+
+        # (фон, текст) для зон SCORE_COLOR_THRESHOLDS: погана, середня, добра
+        self.score_colors = (
+            (self.poor_bg_color, self.poor_text_color),
+            (self.average_bg_color, self.average_text_color),
+            (self.good_bg_color, self.good_text_color),
+        )
+
+        # (фон, текст) для рейтингів метрик; решта рейтингів ("poor", "N/A") - як погані
+        self.rating_colors = {
+            "good": (self.good_bg_color, self.good_text_color),
+            "average": (self.average_bg_color, self.average_text_color),
+        }
         
         # Кольори для діаграми
-        self.mobile_color = colors.HexColor("#3182ce")  # Синій для мобільного
-        self.desktop_color = colors.HexColor("#38a169")  # Зелений для десктопу
+        self.mobile_color = MOBILE_COLOR
+        self.desktop_color = DESKTOP_COLOR
+
+    @staticmethod
+    def _build_table_styles(font_name):
+        """
+        Створює базові стилі таблиць, спільні для всіх звітів.
+
+        Звіти успадковують їх через TableStyle(parent=...) і додають лише
+        команди кольорового кодування рядків.
+
+        Args:
+            font_name (str): Назва зареєстрованого шрифту
+
+        Returns:
+            dict: Базові стилі таблиць та порожній кеш scores_table_styles
+        """
+        scores_table_style = TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), HEADER_BG_COLOR),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ("ALIGN", (0, 1), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, -1), font_name),
+            ("FONTSIZE", (0, 0), (-1, 0), 14),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("TOPPADDING", (0, 0), (-1, 0), 8),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black)
+        ])
+
+        metrics_table_style = TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), HEADER_BG_COLOR),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ("ALIGN", (0, 1), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (-1, -1), font_name),
+            ("FONTSIZE", (0, 0), (-1, 0), 12),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+            ("TOPPADDING", (0, 0), (-1, 0), 8),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ])
+
+        recommendations_table_style = TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), HEADER_BG_COLOR),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), font_name),
+            ("FONTSIZE", (0, 0), (-1, 0), 10),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 6),
+            ("TOPPADDING", (0, 0), (-1, 0), 4),
+
+            ("FONTNAME", (0, 1), (-1, -1), font_name),
+            ("FONTSIZE", (0, 1), (-1, -1), 10),  # як small_style у клітинках-Paragraph
+            ("ALIGN", (1, 1), (-1, -1), "CENTER"),
+            ("ALIGN", (0, 1), (0, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ("BOX", (0, 0), (-1, -1), 1, colors.black),
+        ])
+
+        # Таблиця статистики має фіксовану структуру, тому стиль використовується як є
+        bold_font_name = font_name
+        summary_table_style = TableStyle([
+            ("FONTNAME", (0, 0), (-1, -1), font_name),
+            ("FONTSIZE", (0, 0), (-1, -1), 10),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("ALIGN", (1, 0), (1, -1), "CENTER"),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+            ("FONTNAME", (0, 0), (-1, 0), bold_font_name),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+            ("TOPPADDING", (0, 0), (-1, -1), 4),
+            ("LINEABOVE", (0, 4), (-1, 4), 0.5, colors.white),
+            ("LINEBELOW", (0, 4), (-1, 4), 0.5, colors.white),
+            ("LINEABOVE", (0, 8), (-1, 8), 0.5, colors.white),
+            ("LINEBELOW", (0, 8), (-1, 8), 0.5, colors.white),
+            ("TEXTCOLOR", (0, 4), (-1, 4), colors.white),
+            ("TEXTCOLOR", (0, 8), (-1, 8), colors.white),
+            ("FONTNAME", (0, 9), (1, 9), bold_font_name),
+        ])
+
+        return {
+            "scores_table_style": scores_table_style,
+            "metrics_table_style": metrics_table_style,
+            "recommendations_table_style": recommendations_table_style,
+            "summary_table_style": summary_table_style,
+            # Готові стилі таблиці оцінок {(зона мобільної, зона десктопної оцінки): TableStyle}
+            "scores_table_styles": {},
+        }
     
-    def generate_report(self, url, mobile_results, desktop_results):
+    def generate_report(self, url, mobile_results, desktop_results, generated_at=None, output=None):
         """
         Створює PDF-звіт на основі результатів аналізу.
         
@@ -137,11 +331,22 @@ class PDFReportGenerator:
             url (str): Проаналізований URL
             mobile_results (dict): Результати аналізу для мобільних пристроїв
             desktop_results (dict): Результати аналізу для десктопів
+            generated_at (datetime, optional): Час аналізу для заголовка звіту.
+                                              За замовчуванням поточний час; при пакетній
+                                              генерації можна передати один час для всіх звітів
+            output (str, PathLike or file-like, optional): Шлях до файлу або відкритий потік, куди
+                                                 записується PDF без проміжного буфера в пам'яті.
+                                                 За замовчуванням PDF повертається як BytesIO
             
         Returns:
-            BytesIO: PDF-файл у форматі байтів
+            BytesIO: PDF-файл у форматі байтів (якщо output не задано), інакше output
         """
-        buffer = io.BytesIO()
+        if output is None:
+            buffer = io.BytesIO()
+        elif isinstance(output, os.PathLike):
+            buffer = os.fspath(output)
+        else:
+            buffer = output
         
         # Створення документа
         doc = SimpleDocTemplate(
@@ -156,37 +361,51 @@ class PDFReportGenerator:
             subject=PDF_SUBJECT
         )
         
+        # Відсутні результати (None) нормалізуються один раз до порожніх словників
+        mobile_results = mobile_results or {}
+        desktop_results = desktop_results or {}
+        mobile_metrics = mobile_results.get("metrics")
+        desktop_metrics = desktop_results.get("metrics")
+
         # Елементи документа
         elements = []
         
         # Додавання заголовка і базової інформації
-        self._add_header_and_info(elements, url)
+        now = generated_at or datetime.now()
+        analysis_date = f"{now.day:02d}.{now.month:02d}.{now.year} {now.hour:02d}:{now.minute:02d}"
+        self._add_header_and_info(elements, url, analysis_date)
         
         # Додавання оцінок продуктивності
-        self._add_performance_scores(elements, mobile_results, desktop_results, doc.width)
+        self._add_performance_scores(
+            elements,
+            mobile_results.get("score", 0),
+            desktop_results.get("score", 0),
+            doc.width
+        )
         
         # Додавання детальних метрик для мобільної версії
-        if mobile_results and "metrics" in mobile_results:
+        if mobile_metrics is not None:
             self._add_metrics_section(
                 elements,
                 "Метрики для мобільних пристроїв",
-                mobile_results["metrics"],
+                mobile_metrics,
                 doc.width
             )
         
         # Додавання детальних метрик для десктопної версії
-        if desktop_results and "metrics" in desktop_results:
+        if desktop_metrics is not None:
             self._add_metrics_section(
                 elements,
                 "Метрики для комп'ютерів",
-                desktop_results["metrics"],
+                desktop_metrics,
                 doc.width
             )
         
         # Додавання пріоритезованих рекомендацій
-        recommendations_data = mobile_results.get("prioritized_recommendations") if mobile_results else None
-        if not recommendations_data and desktop_results:
-            recommendations_data = desktop_results.get("prioritized_recommendations")
+        recommendations_data = (
+            mobile_results.get("prioritized_recommendations")
+            or desktop_results.get("prioritized_recommendations")
+        )
 
         if recommendations_data and recommendations_data.get("categories"):
             self._add_prioritized_recommendations_section(elements, recommendations_data, doc.width)
@@ -196,48 +415,42 @@ class PDFReportGenerator:
         
         # Створення PDF
         doc.build(elements)
+        if output is not None:
+            return output
+
         buffer.seek(0)
-        
         return buffer
 
-    def _add_header_and_info(self, elements, url):
+    def _add_header_and_info(self, elements, url, analysis_date):
         """
         Додає заголовок та інформацію про аналізований сайт.
         
         Args:
             elements (list): Список елементів PDF
             url (str): Проаналізований URL
+            analysis_date (str): Відформатована дата аналізу
         """
         elements.append(Paragraph(PDF_TITLE, self.title_style))
         elements.append(Spacer(1, 0.5*cm))
         
         # Інформація про сайт
         elements.append(Paragraph(f"URL: {url}", self.normal_style))
-        elements.append(
-            Paragraph(
-                f"Дата аналізу: {datetime.now().strftime('%d.%m.%Y %H:%M')}",
-                self.normal_style
-            )
-        )
+        elements.append(Paragraph(f"Дата аналізу: {analysis_date}", self.normal_style))
         elements.append(Spacer(1, 1*cm))
     
-    def _add_performance_scores(self, elements, mobile_results, desktop_results, width):
+    def _add_performance_scores(self, elements, mobile_score, desktop_score, width):
         """
         Додає секцію з загальними оцінками продуктивності.
         
         Args:
             elements (list): Список елементів PDF
-            mobile_results (dict): Результати для мобільних пристроїв
-            desktop_results (dict): Результати для десктопу
+            mobile_score (int): Оцінка для мобільних пристроїв (0-100)
+            desktop_score (int): Оцінка для десктопу (0-100)
             width (float): Ширина документа
         """
         elements.append(Paragraph("Загальні оцінки продуктивності", self.heading_style))
         elements.append(Spacer(1, 0.3*cm))
         
-        # Отримання оцінок з результатів, з перевіркою на наявність даних
-        mobile_score = mobile_results.get("score", 0) if mobile_results else 0
-        desktop_score = desktop_results.get("score", 0) if desktop_results else 0
-        
         # Таблиця оцінок
         data = [
             ["Пристрій", "Оцінка", "Статус"],
@@ -248,39 +461,23 @@ class PDFReportGenerator:
         # Створення та стилізація таблиці
         table = Table(data, colWidths=[width/3.0]*3)
         
-        # Визначення стилю таблиці
-        font_name = "Ukrainian" if self.use_ukrainian_font else "Helvetica"
-        
-        # Базові стилі таблиці
-        table_style = [
-            ("BACKGROUND", (0, 0), (-1, 0), self.header_bg_color),
-            ("TEXTCOLOR", (0, 0), (-1, 0), self.header_text_color),
-            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-            ("ALIGN", (0, 1), (-1, -1), "CENTER"),
-            ("FONTNAME", (0, 0), (-1, -1), font_name),
-            ("FONTSIZE", (0, 0), (-1, 0), 14),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-            ("TOPPADDING", (0, 0), (-1, 0), 8),
-            ("GRID", (0, 0), (-1, -1), 1, colors.black)
-        ]
-        
-        # Додавання кольорового кодування оцінок
-        for i, row in enumerate(data[1:], 1):
-            score = int(row[1].split("/")[0])
-            if score >= 90:
-                bg_color = self.good_bg_color
-                text_color = self.good_text_color
-            elif score >= 50:
-                bg_color = self.average_bg_color
-                text_color = self.average_text_color
-            else:
-                bg_color = self.poor_bg_color
-                text_color = self.poor_text_color
-                
-            table_style.append(("BACKGROUND", (1, i), (2, i), bg_color))
-            table_style.append(("TEXTCOLOR", (1, i), (2, i), text_color))
-        
-        table.setStyle(TableStyle(table_style))
+        # Кольорове кодування оцінок залежить лише від зон обох оцінок (3x3 варіанти),
+        # тому готовий стиль береться з кешу, спільного для всіх звітів
+        buckets = (
+            bisect_right(SCORE_COLOR_THRESHOLDS, mobile_score),
+            bisect_right(SCORE_COLOR_THRESHOLDS, desktop_score),
+        )
+        table_style = self.scores_table_styles.get(buckets)
+        if table_style is None:
+            commands = []
+            for i, bucket in enumerate(buckets, 1):
+                bg_color, text_color = self.score_colors[bucket]
+                commands.append(("BACKGROUND", (1, i), (2, i), bg_color))
+                commands.append(("TEXTCOLOR", (1, i), (2, i), text_color))
+            table_style = TableStyle(commands, parent=self.scores_table_style)
+            self.scores_table_styles[buckets] = table_style
+        
+        table.setStyle(table_style)
         elements.append(table)
         elements.append(Spacer(1, 1*cm))
 
@@ -301,50 +498,29 @@ class PDFReportGenerator:
         elements.append(Paragraph(title, self.heading_style))
         elements.append(Spacer(1, 0.3*cm))
         
-        # Підготовка даних для таблиці
+        # Підготовка даних для таблиці та кольорового кодування оцінок за один прохід
+        # (базовий стиль таблиці спільний для всіх звітів)
         metrics_data = [["Метрика", "Значення", "Оцінка"]]
+        table_style = []
+        rating_colors = self.rating_colors
+        poor_colors = (self.poor_bg_color, self.poor_text_color)
         
-        for metric_name, metric_data in metrics.items():
+        for i, (metric_name, metric_data) in enumerate(metrics.items(), 1):
+            rating = metric_data.get("rating", "N/A")
             metrics_data.append([
                 metric_name, 
                 metric_data.get("value", "N/A"), 
-                metric_data.get("rating", "N/A")
+                rating
             ])
-        
-        # Створення таблиці з метриками
-        font_name = "Ukrainian" if self.use_ukrainian_font else "Helvetica"
-        metrics_table = Table(metrics_data, colWidths=[width*0.5, width*0.25, width*0.25])
-        
-        # Базові стилі таблиці
-        table_style = [
-            ("BACKGROUND", (0, 0), (-1, 0), self.header_bg_color),
-            ("TEXTCOLOR", (0, 0), (-1, 0), self.header_text_color),
-            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-            ("ALIGN", (0, 1), (-1, -1), "LEFT"),
-            ("FONTNAME", (0, 0), (-1, -1), font_name),
-            ("FONTSIZE", (0, 0), (-1, 0), 12),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-            ("TOPPADDING", (0, 0), (-1, 0), 8),
-            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-        ]
-        
-        # Додавання кольорового кодування для оцінок
-        for i, row in enumerate(metrics_data[1:], 1):
-            rating = row[2].lower()
-            if rating == "good":
-                bg_color = self.good_bg_color
-                text_color = self.good_text_color
-            elif rating == "average":
-                bg_color = self.average_bg_color
-                text_color = self.average_text_color
-            else:  # poor or other
-                bg_color = self.poor_bg_color
-                text_color = self.poor_text_color
-                
+
+            # Рейтинги вже в нижньому регістрі (PageSpeedAnalyzer._get_metric_rating)
+            bg_color, text_color = rating_colors.get(rating, poor_colors)
             table_style.append(("BACKGROUND", (2, i), (2, i), bg_color))
             table_style.append(("TEXTCOLOR", (2, i), (2, i), text_color))
         
-        metrics_table.setStyle(TableStyle(table_style))
+        # Створення таблиці з метриками
+        metrics_table = Table(metrics_data, colWidths=[width*0.5, width*0.25, width*0.25])
+        metrics_table.setStyle(TableStyle(table_style, parent=self.metrics_table_style))
         elements.append(metrics_table)
         elements.append(Spacer(1, 0.7*cm))
     
@@ -391,40 +567,23 @@ class PDFReportGenerator:
                 Paragraph(PRIORITIZATION_TERMS_UK["savings_label"], self.small_style)
             ]]
 
-            font_name = "Ukrainian" if self.use_ukrainian_font else "Helvetica"
-
+            # Paragraph лише для назви, яка може переноситися; короткі мітки впливу,
+            # складності та економії - звичайні рядки, стилізовані самою таблицею
+            small_style = self.small_style
             for rec in recs_in_category:
                 savings_text = f"{rec['potential_savings_ms']} мс" if rec['potential_savings_ms'] is not None else "-"
-                title_paragraph = Paragraph(rec['title'], self.small_style)
 
                 table_data.append([
-                    title_paragraph,
-                    Paragraph(rec['impact_level_uk'], self.small_style),
-                    Paragraph(rec['difficulty_level_uk'], self.small_style),
-                    Paragraph(savings_text, self.small_style)
+                    Paragraph(rec['title'], small_style),
+                    rec['impact_level_uk'],
+                    rec['difficulty_level_uk'],
+                    savings_text
                 ])
 
             col_widths = [width * 0.55, width * 0.15, width * 0.15, width * 0.15]
             category_table = Table(table_data, colWidths=col_widths)
 
-            style = TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), self.header_bg_color),
-                ('TEXTCOLOR', (0, 0), (-1, 0), self.header_text_color),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), font_name),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-                ('TOPPADDING', (0, 0), (-1, 0), 4),
-
-                ('FONTNAME', (0, 1), (-1, -1), font_name),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BOX', (0, 0), (-1, -1), 1, colors.black),
-            ])
+            style = TableStyle(parent=self.recommendations_table_style)
 
             for i, rec in enumerate(recs_in_category, 1):
                 if rec['impact_level'] == 'high':
@@ -477,30 +636,8 @@ class PDFReportGenerator:
             ["Всього рекомендацій", str(total)]
         ]
 
-        font_name = "Ukrainian" if self.use_ukrainian_font else "Helvetica"
-        bold_font_name = font_name
-
         summary_table = Table(data, colWidths=[width * 0.7, width * 0.3])
-
-        style = TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, 0), bold_font_name),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('LINEABOVE', (0, 4), (-1, 4), 0.5, colors.white),
-            ('LINEBELOW', (0, 4), (-1, 4), 0.5, colors.white),
-            ('LINEABOVE', (0, 8), (-1, 8), 0.5, colors.white),
-            ('LINEBELOW', (0, 8), (-1, 8), 0.5, colors.white),
-            ('TEXTCOLOR', (0, 4), (-1, 4), colors.white),
-            ('TEXTCOLOR', (0, 8), (-1, 8), colors.white),
-            ('FONTNAME', (0, 9), (1, 9), bold_font_name),
-        ])
-        summary_table.setStyle(style)
+        summary_table.setStyle(self.summary_table_style)
 
         elements.append(summary_table)
         elements.append(Spacer(1, 0.7*cm))
\ No newline at end of file